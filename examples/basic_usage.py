@@ -1,14 +1,14 @@
 from porter_api import PorterAPI, get_porter_quote
 
-# Example 1: Using the PorterAPI class
-porter = PorterAPI(name="John Doe", phone="9876543210")
-quote = porter.get_quote(
-    pickup_address="Koramangala, Bangalore",
-    drop_address="Electronic City, Bangalore",
-    city="Bangalore",
-    service_type="trucks"
-)
-print("Class API result:", quote)
+# Example 1: Using the PorterAPI class (the browser stays open until the with-block ends)
+with PorterAPI(name="John Doe", phone="9876543210") as porter:
+    quote = porter.get_quote(
+        pickup_address="Koramangala, Bangalore",
+        drop_address="Electronic City, Bangalore",
+        city="Bangalore",
+        service_type="trucks"
+    )
+    print("Class API result:", quote)
 
 # Example 2: Using the convenience function
 quote2 = get_porter_quote(
@@ -1,5 +1,9 @@
+import logging
+
 from porter_api import PorterAPI
 
+logging.basicConfig(level=logging.INFO)  # show progress while the browser works
+
 porter = PorterAPI(name="Arjun Rampal", phone="9876546843", headless=False)
 
 quote = porter.get_quote(
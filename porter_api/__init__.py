@@ -1,3 +1,3 @@
-from .core import PorterAPI, get_porter_quote
+from .core import PorterAPI, PorterAPIPool, get_porter_quote, get_porter_quotes_bulk
 
 # __init__.py for porter_api package
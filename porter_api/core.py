@@ -1,57 +1,291 @@
+import asyncio
+import atexit
+import functools
+import hashlib
+import json
+import logging
+import os
+import queue
 import re
+import socket
+import string
+import tempfile
+import threading
 import time
-from typing import List, Dict, Optional, Tuple
-from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator, List, Dict, Optional, Tuple
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException, 
     NoSuchElementException, 
     ElementClickInterceptedException,
+    JavascriptException,
+    StaleElementReferenceException,
     WebDriverException
 )
-from webdriver_manager.chrome import ChromeDriverManager
 
 from .models import VehicleQuote
 from .exceptions import PorterAPIError
 
-sleep_time = 1
-time.sleep(sleep_time)  # Initial sleep to allow imports to settle and network to stabilize
+logger = logging.getLogger(__name__)
+
+# Fallback selectors, in the order they are tried
+_REQUIREMENT_SELECTORS = (
+    '.FareEstimateRequirement_requirement-input__4YZ93',
+    '[class*="requirement-input"]',
+    'input[name="requirement"]'
+)
+
+_AUTOCOMPLETE_SELECTORS = (
+    "[class*='autocomplete'] li",
+    "[class*='suggestion'] li",
+    "[class*='dropdown'] li",
+    "[class*='option']",
+    "ul li",
+    ".pac-item",
+    "[role='option']"
+)
+# Last-resort entries above that also match lists unrelated to the dropdown;
+# never remembered as the selector to try first
+_BROAD_AUTOCOMPLETE_SELECTORS = frozenset({"[class*='option']", "ul li"})
+
+# Options of whichever suggestion dropdown the address inputs open
+_AUTOCOMPLETE_OPTION_SELECTOR = (
+    "[class*='autocomplete'] li, [class*='suggestion'] li, [class*='dropdown'] li, .pac-item, [role='option']"
+)
+
+_SERVICE_CONTAINER_SELECTOR = "[class*='CategorySelector'][class*='container'], [class*='category'][class*='container']"
+
+# Same containers, narrowed to those whose text contains {target} (lowercase)
+_SERVICE_CONTAINER_XPATH = (
+    "//*[(contains(@class, 'CategorySelector') or contains(@class, 'category'))"
+    " and contains(@class, 'container')"
+    f" and contains(translate(., '{string.ascii_uppercase}', '{string.ascii_lowercase}'), '{{target}}')]"
+)
+
+# City entry in the selector modal whose text contains {city} (lowercase)
+_CITY_TITLE_XPATH = (
+    "//*[starts-with(@class, 'CitySelectorModal_city-title')"
+    f" and contains(translate(., '{string.ascii_uppercase}', '{string.ascii_lowercase}'), '{{city}}')]"
+)
+
+# Returns [element, selector] for the first selector in arguments[0] that
+# matches anything (priority order, unlike a comma-joined selector), or null
+_FIRST_MATCH_JS = """
+for (const selector of arguments[0]) {
+    const element = document.querySelector(selector);
+    if (element) return [element, selector];
+}
+return null;
+"""
+
+# Sets [selector, value] pairs through the native value setter and fires
+# input/change so React picks the values up; returns the first missing selector
+_FILL_INPUTS_JS = """
+const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+for (const [selector, value] of arguments[0]) {
+    const input = document.querySelector(selector);
+    if (!input) return selector;
+    setValue.call(input, value);
+    input.dispatchEvent(new Event('input', {bubbles: true}));
+    input.dispatchEvent(new Event('change', {bubbles: true}));
+}
+return null;
+"""
+
+# Clicks the first requirement radio matching the selectors (arguments[0]),
+# falling back to the label containing arguments[1]
+_SELECT_REQUIREMENT_JS = """
+const [selectors, labelText] = arguments;
+for (const selector of selectors) {
+    const input = document.querySelector(selector);
+    if (!input) continue;
+    if (!input.checked) input.click();
+    return {selected: true, via: selector};
+}
+const label = Array.from(document.querySelectorAll('label')).find(l => l.textContent.includes(labelText));
+if (label) {
+    label.click();
+    return {selected: true, via: 'label'};
+}
+return {selected: false, via: null};
+"""
+
+# Clicks the last container (selector in arguments[0]) whose text contains the
+# lowercased service name in arguments[1]; returns its index, or -1
+_CLICK_SERVICE_JS = """
+const [selector, target] = arguments;
+const containers = Array.from(document.querySelectorAll(selector));
+for (let i = containers.length - 1; i >= 0; i--) {
+    if (containers[i].innerText.toLowerCase().includes(target)) {
+        containers[i].click();
+        return i;
+    }
+}
+return -1;
+"""
+
+_RESULT_CARD_CLASS = "FareEstimateResultVehicleCard_container__BdMav"
+
+# Reads name, fare and capacity text of every result card (class in arguments[0]);
+# plain class lookups use getElementsByClassName, which skips selector parsing
+_READ_RESULT_CARDS_JS = """
+return Array.from(document.getElementsByClassName(arguments[0])).map(card => ({
+    vehicle_name: card.getElementsByClassName('FareEstimateResultVehicleCard_vehicle-name__d4107')[0]?.innerText ?? null,
+    price_text: card.querySelector('.FareEstimateResultVehicleCard_vehicle-fare__3YMOc p')?.innerText ?? null,
+    capacity: card.getElementsByClassName('VehicleCapacity_vehicle-capacity__P53Z0')[0]?.innerText ?? null
+}));
+"""
+
+# Startup work and background services a scripted session never uses
+_CHROME_LEAN_FLAGS = (
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-translate",
+    "--metrics-recording-only",
+    "--no-first-run",
+    "--mute-audio",
+    "--disable-features=Translate,BackForwardCache,OptimizationHints"
+)
+
+# Requests the quote form never needs; blocked so page loads finish sooner
+_BLOCKED_URL_PATTERNS = [
+    "*.woff", "*.woff2", "*.ttf",
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp",
+    "*googletagmanager*", "*google-analytics*", "*facebook.net*", "*doubleclick.net*"
+]
+
+_DIGITS_RE = re.compile(r"\d+")
+# First two amounts in "₹1,585 - ₹1,615", "Rs. 585 to 615" or "₹585", whatever
+# separates them; commas are thousands separators
+_PRICE_RANGE_RE = re.compile(r"(\d[\d,]*)(?:\D+?(\d[\d,]*))?")
+
+class _QuoteCache:
+    """On-disk cache of successful quotes, one JSON file per route"""
+
+    def __init__(self, directory: str = "~/.porter_api/cache"):
+        self.directory = os.path.expanduser(directory)
+
+    @staticmethod
+    def key(city: str, service_type: str, pickup_address: str, drop_address: str) -> str:
+        route = f"{city}|{service_type}|{pickup_address}|{drop_address}"
+        return hashlib.blake2b(route.encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str, max_age: int) -> Optional[Dict]:
+        """Return the cached response if it is younger than max_age seconds"""
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cached, dict):
+            return None
+        timestamp = cached.get("timestamp_epoch")
+        if not isinstance(timestamp, (int, float)):
+            return None
+        if time.time() - timestamp >= max_age:
+            return None
+        return cached
+
+    def set(self, key: str, response: Dict) -> None:
+        """Store a response; a cache that can't be written is simply skipped"""
+        # The caller's details are filled in again on every read; keep them off disk
+        stored = {k: v for k, v in response.items() if k not in ("user_name", "user_phone")}
+        tmp_path = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # A private temp file per write, so concurrent writers never share one
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(stored, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+# WebDriverWait polls every 0.5s by default, so a ready element is noticed
+# 250ms late on average; UI transitions here are short, so poll faster
+_POLL_FREQUENCY = 0.1
+
+# How long the main page steps (and the results) may take to show up
+_PAGE_TIMEOUT = 15
+
+def _warm_dns(host: str) -> None:
+    """Look a host up once so the resolver cache is warm; failures are ignored"""
+    try:
+        socket.getaddrinfo(host, 443)
+    except OSError:
+        pass
+
+def _wait_for(driver, condition, timeout: float = 5, poll_frequency: float = _POLL_FREQUENCY):
+    """Wait for an expected condition; returns its value, or None on timeout"""
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=poll_frequency).until(condition)
+    except TimeoutException:
+        return None
 
 def _validate_phone(phone: str) -> str:
     """Validate phone number format"""
-    if not re.fullmatch(r"\d{10}", phone):
-        raise PorterAPIError(
-            "Phone number must be exactly 10 digits. "
-            "No country codes, spaces, or special characters please! 📱"
-        )
-    return phone
+    # isdecimal() accepts the same characters as the regex \d did
+    if len(phone) == 10 and phone.isdecimal():
+        return phone
+    raise PorterAPIError(
+        "Phone number must be exactly 10 digits. "
+        "No country codes, spaces, or special characters please! 📱"
+    )
 
 def _parse_price_range(price_text: str) -> Tuple[Optional[int], Optional[int]]:
     """Parse price range from text like '₹585 - ₹615'"""
-    match = re.findall(r"\d+", price_text.replace(",", ""))
-    if len(match) == 2:
-        return int(match[0]), int(match[1])
-    elif len(match) == 1:
-        return int(match[0]), int(match[0])
-    return None, None
+    match = _PRICE_RANGE_RE.search(price_text)
+    if not match:
+        return None, None
+    min_text, max_text = match.groups()
+    min_price = int(min_text.replace(",", ""))
+    return min_price, int(max_text.replace(",", "")) if max_text else min_price
 
 def _parse_capacity(capacity_text: str) -> Optional[int]:
     """Parse capacity from text like '500 kg'"""
-    match = re.search(r"(\d+)", capacity_text.replace(",", ""))
-    return int(match.group(1)) if match else None
+    match = _DIGITS_RE.search(capacity_text.replace(",", ""))
+    return int(match.group()) if match else None
 
 class PorterAPI:
-    SUPPORTED_CITIES = [
+    SUPPORTED_CITIES = (
         "Bangalore", "Mumbai", "Delhi", "Chennai", "Hyderabad", "Pune"
-    ]
-    SERVICE_TYPES = ["two_wheelers", "trucks", "packers_and_movers"]
+    )
+    SERVICE_TYPES = ("two_wheelers", "trucks", "packers_and_movers")
+    _SUPPORTED_CITIES_SET = frozenset(SUPPORTED_CITIES)
+    _SERVICE_TYPES_SET = frozenset(SERVICE_TYPES)
+    # Label Porter.in shows for each service type
+    _SERVICE_LABELS = {
+        "two_wheelers": "Two Wheelers",
+        "trucks": "Trucks",
+        "packers_and_movers": "Packers & Movers"
+    }
 
-    def __init__(self, name: str, phone: str, headless: bool = True):
+    # chromedriver and Chrome paths found by Selenium Manager on the first
+    # launch, shared by every instance so later launches skip the lookup
+    _driver_path: Optional[str] = None
+    _browser_path: Optional[str] = None
+    _paths_lock = threading.Lock()
+
+    def __init__(self, name: str, phone: str, headless: bool = True, profile_dir: Optional[str] = None):
         """
         Initialize Porter API client
         
@@ -59,25 +293,146 @@ class PorterAPI:
             name: Your name (be nice, use your real name!)
             phone: 10-digit phone number
             headless: Run browser in headless mode (True = invisible, False = see the magic)
+            profile_dir: Keep Chrome's profile (and HTTP cache) in this directory so
+                later launches start warm; one running browser per directory
         """
         self.name = name
         self.phone = _validate_phone(phone)
         self.headless = headless
+        self.profile_dir = os.path.expanduser(profile_dir) if profile_dir else None
+        self._driver = None
+        self._wait: Optional[WebDriverWait] = None
+        self._last_city: Optional[str] = None
+        self._last_good_autocomplete_selector: Optional[str] = None
+        self._cache = _QuoteCache()
+
+    def __enter__(self) -> "PorterAPI":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def close(self) -> None:
+        """Quit the browser if one is running (safe to call more than once)"""
+        driver = getattr(self, "_driver", None)
+        if driver is None:
+            return
+        self._driver = None
+        self._wait = None
+        self._last_city = None
+        try:
+            driver.quit()
+            logger.info("🛑 Browser closed")
+        except Exception:
+            pass
+
+    @classmethod
+    def _get_service(cls, chrome_options: Options) -> Service:
+        """Service for a new browser, reusing previously resolved paths when they still exist"""
+        with cls._paths_lock:
+            if cls._driver_path and os.path.isfile(cls._driver_path):
+                if cls._browser_path:
+                    chrome_options.binary_location = cls._browser_path
+                return Service(executable_path=cls._driver_path)
+        # No path yet: Selenium Manager resolves (and downloads if needed) one
+        return Service()
 
-    def get_supported_cities(self) -> List[str]:
-        """Get list of supported cities"""
-        return self.SUPPORTED_CITIES.copy()
+    @classmethod
+    def _remember_paths(cls, driver_path: Optional[str], browser_path: Optional[str]) -> None:
+        with cls._paths_lock:
+            cls._driver_path = driver_path or None
+            cls._browser_path = browser_path or None
 
-    def get_supported_service_types(self) -> List[str]:
-        """Get list of supported service types"""
-        return self.SERVICE_TYPES.copy()
+    def _build_chrome_options(self) -> Options:
+        """Chrome options for a short scripted session: no images, no background services"""
+        chrome_options = Options()
+        # Return from driver.get() at DOMContentLoaded; explicit waits cover the rest
+        chrome_options.page_load_strategy = "eager"
+        if self.headless:
+            chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--window-size=1920,1080")
+        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2
+        })
+        for flag in _CHROME_LEAN_FLAGS:
+            chrome_options.add_argument(flag)
+        if self.profile_dir:
+            chrome_options.add_argument(f"--user-data-dir={self.profile_dir}")
+        return chrome_options
+
+    def _get_driver(self):
+        """
+        Return the persistent Chrome driver, launching it on first use
+
+        Between quotes the existing browser is reused and its cookies are
+        cleared; if it died in the meantime a fresh one is started.
+        """
+        if self._driver is not None:
+            try:
+                self._driver.delete_all_cookies()
+                return self._driver
+            except WebDriverException:
+                self.close()
+
+        # Resolve porter.in while Chrome starts, so its first navigation
+        # doesn't wait on DNS (where the OS keeps a resolver cache)
+        threading.Thread(target=_warm_dns, args=("porter.in",), daemon=True).start()
+        
+        chrome_options = self._build_chrome_options()
+        service = self._get_service(chrome_options)
+        self._driver = webdriver.Chrome(service=service, options=chrome_options)
+        self._wait = WebDriverWait(self._driver, _PAGE_TIMEOUT, poll_frequency=_POLL_FREQUENCY)
+        self._remember_paths(service.path, chrome_options.binary_location)
+        self._driver.execute_cdp_cmd("Network.enable", {})
+        self._driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": _BLOCKED_URL_PATTERNS})
+        return self._driver
+
+    async def get_quotes_batch(self, requests: List[Dict], concurrency: int = 4) -> List[Dict]:
+        """
+        Get several quotes concurrently, one browser per worker
+        
+        Args:
+            requests: get_quote keyword arguments, one dict per quote
+                (pickup_address, drop_address, city and optionally service_type)
+            concurrency: Number of browsers to run side by side
+            
+        Returns:
+            List of quote/error dictionaries in the same order as requests
+        """
+        # Starting and quitting the browsers blocks, so keep it off the event loop
+        loop = asyncio.get_running_loop()
+        pool = await loop.run_in_executor(None, functools.partial(
+            PorterAPIPool, self.name, self.phone, size=concurrency,
+            headless=self.headless, profile_dir=self.profile_dir
+        ))
+        try:
+            return await pool.get_quotes_batch(requests)
+        finally:
+            await loop.run_in_executor(None, pool.close)
+
+    def get_supported_cities(self) -> Tuple[str, ...]:
+        """Get the supported cities"""
+        return self.SUPPORTED_CITIES
+
+    def get_supported_service_types(self) -> Tuple[str, ...]:
+        """Get the supported service types"""
+        return self.SERVICE_TYPES
 
     def _create_error_response(self, error_msg: str, details: str = None, suggestion: str = None) -> Dict:
         """Create a standardized error response"""
         response = {
             "success": False,
             "error": error_msg,
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp_epoch": int(time.time())
         }
         
         if details:
@@ -93,214 +448,139 @@ class PorterAPI:
         return response
 
     def select_requirement_type(self, driver, wait, requirement_type: str = "personal") -> bool:
-        """Select the requirement type (Personal User or Business User)"""
+        """
+        Select the requirement type (Personal User or Business User)
+
+        Returns right after the click; get_quote then waits for the pickup
+        address input, which is what the selection is needed for.
+        """
         try:
-            print(f"🎯 Selecting requirement type: {requirement_type}")
-            time.sleep(2)
-            
-            # Try multiple selectors for the requirement radio buttons
-            selectors_to_try = [
-                f'input[value="{requirement_type}"]',
-                '.FareEstimateRequirement_requirement-input__4YZ93',
-                '[class*="requirement-input"]',
-                'input[name="requirement"]'
-            ]
-            
-            for selector in selectors_to_try:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        target_element = elements[0]
-                        
-                        if target_element.is_selected():
-                            print("✅ Requirement already selected")
-                            return True
-                        
-                        try:
-                            target_element.click()
-                            print("✅ Successfully clicked requirement radio button")
-                            time.sleep(1)
-                            return True
-                            
-                        except ElementClickInterceptedException:
-                            parent_label = target_element.find_element(By.XPATH, "./..")
-                            parent_label.click()
-                            print("✅ Successfully clicked parent label")
-                            time.sleep(1)
-                            return True
-                            
-                except Exception as e:
-                    continue
-            
-            # Alternative approach: Find by text content
-            try:
-                labels = driver.find_elements(By.TAG_NAME, "label")
-                for label in labels:
-                    if "Personal User" in label.text:
-                        label.click()
-                        print("✅ Successfully clicked Personal User label")
-                        time.sleep(1)
-                        return True
-                        
-            except Exception:
-                pass
-            
-            # Final attempt: Use JavaScript
-            try:
-                js_script = """
-                const radioButtons = document.querySelectorAll('input[name="requirement"]');
-                for (let radio of radioButtons) {
-                    if (radio.value === 'personal') {
-                        radio.checked = true;
-                        radio.dispatchEvent(new Event('change'));
-                        return true;
-                    }
-                }
-                return false;
-                """
-                result = driver.execute_script(js_script)
-                if result:
-                    print("✅ Successfully selected requirement using JavaScript")
-                    time.sleep(1)
-                    return True
-                    
-            except Exception:
-                pass
+            logger.debug("🎯 Selecting requirement type: %s", requirement_type)
+            _wait_for(driver, EC.presence_of_element_located(
+                (By.CSS_SELECTOR, 'input[name="requirement"], [class*="requirement-input"]')
+            ))
+            
+            # Probe every selector (and the labels) inside the page in one call
+            selectors_to_try = [f'input[value="{requirement_type}"]', *_REQUIREMENT_SELECTORS]
+            result = driver.execute_script(
+                _SELECT_REQUIREMENT_JS, selectors_to_try, f"{requirement_type.title()} User"
+            )
+            if result and result["selected"]:
+                logger.debug("✅ Selected requirement via %s", result['via'])
+                return True
             
-            print("⚠️ Could not select requirement type (continuing anyway)")
+            logger.warning("⚠️ Could not select requirement type (continuing anyway)")
             return False
             
         except Exception as e:
-            print(f"⚠️ Error in select_requirement_type: {e}")
+            logger.warning("⚠️ Error in select_requirement_type: %s", e)
             return False
 
     def select_address_from_autocomplete(self, driver, wait, input_element, address: str) -> bool:
         """Fill address input and select from autocomplete dropdown"""
         try:
-            print(f"📍 Entering address: {address}")
+            logger.debug("📍 Entering address: %s", address)
             
             input_element.clear()
             input_element.send_keys(address)
-            time.sleep(2)
+            _wait_for(driver, EC.presence_of_element_located(
+                (By.CSS_SELECTOR, _AUTOCOMPLETE_OPTION_SELECTOR)
+            ), timeout=3, poll_frequency=0.05)
             
-            # Try multiple selectors for autocomplete options
-            autocomplete_selectors = [
-                "[class*='autocomplete'] li",
-                "[class*='suggestion'] li", 
-                "[class*='dropdown'] li",
-                "[class*='option']",
-                "ul li",
-                ".pac-item",
-                "[role='option']"
-            ]
+            # Try the selector that matched last time first
+            hint = self._last_good_autocomplete_selector
+            selectors = _AUTOCOMPLETE_SELECTORS
+            if hint is not None:
+                selectors = (hint, *(selector for selector in selectors if selector != hint))
             
-            for selector in autocomplete_selectors:
-                try:
-                    autocomplete_options = driver.find_elements(By.CSS_SELECTOR, selector)
+            # One round-trip finds the first option of the best matching selector
+            try:
+                match = driver.execute_script(_FIRST_MATCH_JS, selectors)
+                if match:
+                    first_option, matched_selector = match
+                    if matched_selector not in _BROAD_AUTOCOMPLETE_SELECTORS:
+                        self._last_good_autocomplete_selector = matched_selector
                     
-                    if autocomplete_options:
-                        first_option = autocomplete_options[0]
-                        
-                        try:
-                            first_option.click()
-                            print("✅ Successfully selected from autocomplete")
-                            time.sleep(1)
-                            return True
-                        except ElementClickInterceptedException:
-                            driver.execute_script("arguments[0].click();", first_option)
-                            print("✅ Successfully selected using JavaScript")
-                            time.sleep(1)
-                            return True
-                            
-                except Exception:
-                    continue
+                    try:
+                        first_option.click()
+                        logger.debug("✅ Successfully selected from autocomplete")
+                    except ElementClickInterceptedException:
+                        driver.execute_script("arguments[0].click();", first_option)
+                        logger.debug("✅ Successfully selected using JavaScript")
+                    # The dropdown is torn down once the pick registers
+                    _wait_for(driver, EC.staleness_of(first_option), timeout=3)
+                    return True
+                    
+            except WebDriverException:
+                pass
             
             # Fallback: keyboard navigation
-            print("🎹 Using keyboard navigation...")
-            input_element.send_keys(Keys.ARROW_DOWN)
-            time.sleep(0.5)
-            input_element.send_keys(Keys.ENTER)
-            time.sleep(1)
+            logger.debug("🎹 Using keyboard navigation...")
+            input_element.send_keys(Keys.ARROW_DOWN, Keys.ENTER)
+            _wait_for(driver, EC.invisibility_of_element_located(
+                (By.CSS_SELECTOR, _AUTOCOMPLETE_OPTION_SELECTOR)
+            ), timeout=3)
             return True
             
         except Exception as e:
-            print(f"⚠️ Error in address selection: {e}")
+            logger.warning("⚠️ Error in address selection: %s", e)
             return False
 
+    @staticmethod
+    def _wait_for_estimate_form(driver) -> None:
+        """Clicking a category reveals the rest of the estimate form"""
+        _wait_for(driver, EC.presence_of_element_located(
+            (By.CSS_SELECTOR, 'input[name="requirement"], input[placeholder="Enter pickup address"]')
+        ))
+
     def select_service_type(self, driver, wait, service_type: str) -> bool:
         """Select the service type with robust error handling"""
         try:
-            print(f"🚛 Looking for service type: {service_type}")
-            time.sleep(3)
+            logger.debug("🚛 Looking for service type: %s", service_type)
+            _wait_for(driver, EC.presence_of_element_located(
+                (By.CSS_SELECTOR, "[class*='CategorySelector'], [class*='category-select-container']")
+            ))
             
-            service_mapping = {
-                "two_wheelers": "Two Wheelers",
-                "trucks": "Trucks", 
-                "packers_and_movers": "Packers & Movers"
-            }
-            
-            target_text = service_mapping.get(service_type, "Trucks")
-            print(f"🎯 Target service: {target_text}")
-            
-            # Try to find category selector containers
-            selectors_to_try = [
-                "CategorySelector_category-select-container__LgXjx",
-                "[class*='CategorySelector'][class*='container']",
-                "[class*='category-select-container']",
-                "[class*='category'][class*='container']"
-            ]
+            target_text = self._SERVICE_LABELS.get(service_type, "Trucks")
+            target_lower = target_text.lower()
+            logger.debug("🎯 Target service: %s", target_text)
             
-            service_containers = []
-            for selector in selectors_to_try:
-                try:
-                    if selector.startswith("["):
-                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    else:
-                        elements = driver.find_elements(By.CLASS_NAME, selector)
-                    
-                    if elements:
-                        service_containers = elements
-                        break
-                except Exception:
-                    continue
-            
-            if not service_containers:
-                print("❌ No service containers found!")
-                return False
-            
-            print(f"✅ Found {len(service_containers)} service containers")
-            
-            # Look for the container with our target text
-            for i, container in enumerate(service_containers):
+            # Fast path: find and click the container inside the page
+            try:
+                index = driver.execute_script(_CLICK_SERVICE_JS, _SERVICE_CONTAINER_SELECTOR, target_lower)
+            except WebDriverException:
+                index = -1
+            if index >= 0:
+                logger.debug("✅ Clicked service container %s using JavaScript", index)
+                self._wait_for_estimate_form(driver)
+                return True
+            
+            # Fallback: one XPath query returns only the category containers
+            # holding our text; the last match is the innermost of them
+            container_xpath = _SERVICE_CONTAINER_XPATH.format(target=target_lower)
+            service_containers = driver.find_elements(By.XPATH, container_xpath)
+            
+            if service_containers:
+                container = service_containers[-1]
+                logger.debug("✅ Found target service among %s matching containers", len(service_containers))
+                
                 try:
-                    container_text = container.text
-                    
-                    if target_text.lower() in container_text.lower():
-                        print(f"✅ Found target service in container {i}")
-                        
-                        try:
-                            container.click()
-                            print("✅ Successfully clicked service container")
-                            time.sleep(2)
-                            return True
-                            
-                        except ElementClickInterceptedException:
-                            driver.execute_script("arguments[0].click();", container)
-                            print("✅ Successfully clicked using JavaScript")
-                            time.sleep(2)
-                            return True
-                            
-                except Exception:
-                    continue
+                    container.click()
+                    logger.debug("✅ Successfully clicked service container")
+                except ElementClickInterceptedException:
+                    driver.execute_script("arguments[0].click();", container)
+                    logger.debug("✅ Successfully clicked using JavaScript")
+                self._wait_for_estimate_form(driver)
+                return True
                     
-            print(f"❌ Could not find service type: {target_text}")
+            logger.warning("⚠️ Could not find service type: %s", target_text)
             return False
             
         except Exception as e:
-            print(f"❌ Error in select_service_type: {e}")
+            logger.warning("⚠️ Error in select_service_type: %s", e)
             return False
 
-    def get_quote(self, pickup_address: str, drop_address: str, city: str, service_type: str = "trucks") -> Dict:
+    def get_quote(self, pickup_address: str, drop_address: str, city: str, service_type: str = "trucks", max_age: int = 3600) -> Dict:
         """
         Get delivery quotes from Porter.in
         
@@ -309,68 +589,67 @@ class PorterAPI:
             drop_address: Where to deliver to  
             city: City name (must be supported)
             service_type: Type of service needed
+            max_age: Reuse a cached quote for the same route if it is at most
+                this many seconds old (0 = always fetch fresh)
             
         Returns:
             Dictionary with quotes or error information
         """
         # Validate inputs
-        if city not in self.SUPPORTED_CITIES:
+        if city not in self._SUPPORTED_CITIES_SET:
             return self._create_error_response(
                 f"City '{city}' is not supported 🏙️",
                 f"Supported cities: {', '.join(self.SUPPORTED_CITIES)}",
                 "Please use one of the supported cities or request Porter.in to expand!"
             )
             
-        if service_type not in self.SERVICE_TYPES:
+        if service_type not in self._SERVICE_TYPES_SET:
             return self._create_error_response(
                 f"Service type '{service_type}' is not supported 🚛",
                 f"Supported services: {', '.join(self.SERVICE_TYPES)}",
                 "Check your service_type parameter spelling!"
             )
 
-        # Setup Chrome options
-        chrome_options = Options()
-        if self.headless:
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+        cache_key = _QuoteCache.key(city, service_type, pickup_address, drop_address)
+        if max_age > 0:
+            cached = self._cache.get(cache_key, max_age)
+            if cached is not None:
+                logger.info("⚡ Using cached quote")
+                cached.update(from_cache=True, user_name=self.name, user_phone=self.phone)
+                return cached
 
-        driver = None
         try:
-            # Initialize Chrome driver
-            from selenium.webdriver.chrome.service import Service
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            wait = WebDriverWait(driver, 15)
+            driver = self._get_driver()
+            wait = self._wait
             
-            print("🌐 Opening Porter.in...")
+            logger.info("🌐 Opening Porter.in...")
             driver.get("https://porter.in/")
             
-            # Select city
-            print(f"🏙️ Selecting city: {city}")
+            # Select city, unless the page still shows the one picked last time
             city_selector = wait.until(EC.element_to_be_clickable((By.CLASS_NAME, "CitySelector_city-selected-text__1dNz4")))
-            city_selector.click()
-            
-            city_elements = driver.find_elements(By.CSS_SELECTOR, '[class^="CitySelectorModal_city-title"]')
-            city_found = False
-            for el in city_elements:
-                if city.lower() in el.text.lower():
-                    el.click()
-                    city_found = True
-                    print(f"✅ Selected city: {city}")
-                    break
-                    
-            if not city_found:
-                return self._create_error_response(
-                    f"Could not find city '{city}' on Porter.in 🗺️",
-                    "The city might not be available or Porter.in changed their interface",
-                    "Double-check the city name or try a different supported city"
-                )
+            if self._last_city == city and city.lower() in city_selector.text.lower():
+                logger.debug("✅ City already selected: %s", city)
+            else:
+                logger.info("🏙️ Selecting city: %s", city)
+                city_selector.click()
+                
+                # The modal renders after the click; waiting on the matching
+                # entry itself finds it in the same lookup
+                city_element = _wait_for(driver, EC.presence_of_element_located(
+                    (By.XPATH, _CITY_TITLE_XPATH.format(city=city.lower()))
+                ))
+                if city_element is None:
+                    return self._create_error_response(
+                        f"Could not find city '{city}' on Porter.in 🗺️",
+                        "The city might not be available or Porter.in changed their interface",
+                        "Double-check the city name or try a different supported city"
+                    )
+                city_element.click()
+                self._last_city = city
+                logger.debug("✅ Selected city: %s", city)
                 
             # Open estimate form
-            print("📋 Opening estimate form...")
+            logger.info("📋 Opening estimate form...")
             estimate_card = wait.until(EC.element_to_be_clickable((By.CLASS_NAME, "EstimateCard_estimate-card__NgFIr")))
             estimate_card.click()
             
@@ -383,11 +662,11 @@ class PorterAPI:
                 )
             
             # Select requirement type
-            print("👤 Selecting requirement type...")
+            logger.info("👤 Selecting requirement type...")
             self.select_requirement_type(driver, wait, "personal")
             
             # Fill pickup address
-            print("📍 Filling pickup address...")
+            logger.info("📍 Filling pickup address...")
             try:
                 pickup_input = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, 'input[placeholder="Enter pickup address"]')))
                 self.select_address_from_autocomplete(driver, wait, pickup_input, pickup_address)
@@ -398,26 +677,26 @@ class PorterAPI:
                 )
             
             # Fill drop address
-            print("🎯 Filling drop address...")
+            logger.info("🎯 Filling drop address...")
             try:
-                drop_input = driver.find_element(By.CSS_SELECTOR, 'input[placeholder="Enter drop address"]')
+                drop_input = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, 'input[placeholder="Enter drop address"]')))
                 self.select_address_from_autocomplete(driver, wait, drop_input, drop_address)
-            except NoSuchElementException:
+            except TimeoutException:
                 return self._create_error_response(
                     "Could not find drop address field 🎯",
                     "Porter.in might have changed their form structure"
                 )
             
             # Fill contact details
-            print("📱 Filling contact details...")
+            logger.info("📱 Filling contact details...")
             try:
-                mobile_input = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '.FareEstimateForms_mobile-input__jy5wR')))
-                mobile_input.clear()
-                mobile_input.send_keys(self.phone)
-                
-                name_input = driver.find_element(By.CSS_SELECTOR, '.FareEstimateForms_name-input__n8xyD')
-                name_input.clear()
-                name_input.send_keys(self.name)
+                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '.FareEstimateForms_mobile-input__jy5wR')))
+                missing = driver.execute_script(_FILL_INPUTS_JS, [
+                    ['.FareEstimateForms_mobile-input__jy5wR', self.phone],
+                    ['.FareEstimateForms_name-input__n8xyD', self.name]
+                ])
+                if missing:
+                    raise NoSuchElementException(f"No input matches {missing}")
             except (TimeoutException, NoSuchElementException):
                 return self._create_error_response(
                     "Could not fill contact details 📱",
@@ -425,7 +704,7 @@ class PorterAPI:
                 )
             
             # Submit form
-            print("🚀 Submitting form...")
+            logger.info("🚀 Submitting form...")
             try:
                 submit_btn = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, '.FormInput_submit__ea0jJ.FormInput_submit-enabled__DbSnE.FareEstimateForms_submit-container___lB5u')))
                 submit_btn.click()
@@ -437,10 +716,18 @@ class PorterAPI:
                 )
             
             # Wait for results
-            print("⏳ Waiting for results...")
+            logger.info("⏳ Waiting for results...")
             try:
-                wait.until(EC.presence_of_element_located((By.CLASS_NAME, 'FareEstimateResultVehicleCard_container__BdMav')))
-                result_cards = driver.find_elements(By.CLASS_NAME, 'FareEstimateResultVehicleCard_container__BdMav')
+                # The wait itself returns the card texts, read in one round-trip
+                # per poll, as soon as at least one card is on the page; script
+                # errors while the results page is still swapping in just retry
+                results_wait = WebDriverWait(
+                    driver, _PAGE_TIMEOUT, poll_frequency=_POLL_FREQUENCY,
+                    ignored_exceptions=(JavascriptException, StaleElementReferenceException)
+                )
+                result_cards = results_wait.until(
+                    lambda d: d.execute_script(_READ_RESULT_CARDS_JS, _RESULT_CARD_CLASS) or False
+                )
             except TimeoutException:
                 return self._create_error_response(
                     "Results took too long to load ⏰",
@@ -448,35 +735,29 @@ class PorterAPI:
                     "Try different addresses or run the script again"
                 )
             
-            if not result_cards:
-                return self._create_error_response(
-                    "No delivery options found 📦",
-                    "Porter.in couldn't find any vehicles for your route",
-                    "Try different addresses or check if the route is serviceable"
-                )
-            
             # Parse results
             quotes = []
             for i, card in enumerate(result_cards):
                 try:
-                    vehicle_name = card.find_element(By.CLASS_NAME, 'FareEstimateResultVehicleCard_vehicle-name__d4107').text
-                    price_text = card.find_element(By.CSS_SELECTOR, '.FareEstimateResultVehicleCard_vehicle-fare__3YMOc p').text
+                    if None in card.values():
+                        raise ValueError("card is missing its name, fare or capacity")
+                    price_text = card["price_text"].strip()
                     min_price, max_price = _parse_price_range(price_text)
-                    capacity = card.find_element(By.CLASS_NAME, 'VehicleCapacity_vehicle-capacity__P53Z0').text
-                    capacity_kg = _parse_capacity(capacity)
+                    capacity = card["capacity"].strip()
                     
-                    quotes.append({
-                        "vehicle_name": vehicle_name,
-                        "price_range": price_text,
-                        "min_price": min_price,
-                        "max_price": max_price,
-                        "capacity": capacity,
-                        "capacity_kg": capacity_kg
-                    })
-                    print(f"✅ Parsed quote {i+1}: {vehicle_name}")
+                    quote = VehicleQuote(
+                        name=card["vehicle_name"].strip(),
+                        price_range=price_text,
+                        min_price=min_price,
+                        max_price=max_price,
+                        capacity=capacity,
+                        capacity_kg=_parse_capacity(capacity)
+                    )
+                    quotes.append(quote)
+                    logger.debug("✅ Parsed quote %s: %s", i + 1, quote.name)
                     
                 except Exception as e:
-                    print(f"⚠️ Error parsing quote card {i+1}: {e}")
+                    logger.warning("⚠️ Error parsing quote card %s: %s", i + 1, e)
                     continue
             
             if not quotes:
@@ -486,8 +767,8 @@ class PorterAPI:
                     "Porter.in might have changed their result structure"
                 )
                     
-            print(f"🎉 Successfully retrieved {len(quotes)} quotes!")
-            return {
+            logger.info("🎉 Successfully retrieved %s quotes!", len(quotes))
+            response = {
                 "success": True,
                 "pickup_address": pickup_address,
                 "drop_address": drop_address,
@@ -495,9 +776,13 @@ class PorterAPI:
                 "service_type": service_type,
                 "user_name": self.name,
                 "user_phone": self.phone,
-                "quotes": quotes,
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                "quotes": [quote.to_dict() for quote in quotes],
+                "from_cache": False,
+                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "timestamp_epoch": int(time.time())
             }
+            self._cache.set(cache_key, response)
+            return response
             
         except WebDriverException as e:
             return self._create_error_response(
@@ -512,19 +797,142 @@ class PorterAPI:
                 f"Error: {str(e)}",
                 "This is probably a bug - please report it on GitHub!"
             )
-            
+
+class PorterAPIPool:
+    """
+    A fixed set of PorterAPI clients, each with its own browser, shared by workers
+
+    Every client is handed to one caller at a time, so threads (or asyncio
+    tasks via get_quotes_batch) can fetch quotes side by side without
+    fighting over a single Chrome window.
+    """
+
+    def __init__(self, name: str, phone: str, size: int = 4, headless: bool = True, profile_dir: Optional[str] = None):
+        """
+        Create the pool and start its browsers
+        
+        Args:
+            name: Your name
+            phone: 10-digit phone number
+            size: Number of browsers to keep open
+            headless: Run browsers in headless mode
+            profile_dir: Parent directory for persistent Chrome profiles; each
+                browser gets its own "browser-<n>" subdirectory
+        """
+        if size < 1:
+            raise PorterAPIError("Pool size must be at least 1")
+
+        self.size = size
+        self._apis = [
+            PorterAPI(
+                name=name, phone=phone, headless=headless,
+                profile_dir=os.path.join(profile_dir, f"browser-{i}") if profile_dir else None
+            )
+            for i in range(size)
+        ]
+        self._idle: "queue.Queue[PorterAPI]" = queue.Queue()
+        for api in self._apis:
+            self._idle.put(api)
+
+        # Start the browsers in parallel; a failed launch is retried (and
+        # reported properly) by the first get_quote on that client
+        with ThreadPoolExecutor(max_workers=size) as executor:
+            list(executor.map(self._warm_up, self._apis))
+
+    @staticmethod
+    def _warm_up(api: PorterAPI) -> None:
+        try:
+            api._get_driver()
+        except Exception:
+            pass
+
+    def __enter__(self) -> "PorterAPIPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Quit every browser in the pool"""
+        for api in self._apis:
+            api.close()
+
+    @contextmanager
+    def acquire(self) -> Iterator[PorterAPI]:
+        """Borrow a client, blocking until one is free"""
+        api = self._idle.get()
+        try:
+            yield api
         finally:
-            if driver:
-                try:
-                    driver.quit()
-                    print("🛑 Browser closed")
-                except Exception:
-                    pass
+            self._idle.put(api)
+
+    def get_quote(self, pickup_address: str, drop_address: str, city: str, service_type: str = "trucks", max_age: int = 3600) -> Dict:
+        """Get a quote using whichever client is free next (see PorterAPI.get_quote)"""
+        with self.acquire() as api:
+            return api.get_quote(pickup_address, drop_address, city, service_type, max_age)
+
+    async def get_quotes_batch(self, requests: List[Dict], concurrency: Optional[int] = None) -> List[Dict]:
+        """
+        Get several quotes concurrently
+        
+        Args:
+            requests: get_quote keyword arguments, one dict per quote
+            concurrency: Maximum quotes in flight (defaults to, and is capped at, the pool size)
+            
+        Returns:
+            List of quote/error dictionaries in the same order as requests
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(min(concurrency or self.size, self.size))
+
+        async def fetch(request: Dict) -> Dict:
+            async with semaphore:
+                return await loop.run_in_executor(None, functools.partial(self.get_quote, **request))
+
+        return list(await asyncio.gather(*(fetch(request) for request in requests)))
+
+# Shared clients for get_porter_quote, most recently used last; the browser of
+# a client pushed out of the cache is closed straight away
+_MAX_SHARED_APIS = 16
+_shared_apis: "OrderedDict[Tuple[str, str, bool], PorterAPI]" = OrderedDict()
+_shared_apis_lock = threading.Lock()
+
+def _get_api(name: str, phone: str, headless: bool) -> PorterAPI:
+    """Shared PorterAPI per user, so repeated get_porter_quote calls reuse one browser"""
+    key = (name, phone, headless)
+    evicted = None
+    with _shared_apis_lock:
+        api = _shared_apis.get(key)
+        if api is not None:
+            _shared_apis.move_to_end(key)
+            return api
+        api = PorterAPI(name=name, phone=phone, headless=headless)
+        _shared_apis[key] = api
+        if len(_shared_apis) > _MAX_SHARED_APIS:
+            _, evicted = _shared_apis.popitem(last=False)
+    if evicted is not None:
+        evicted.close()
+    return api
+
+def _close_shared_apis() -> None:
+    """Quit the browsers of every shared client still cached"""
+    with _shared_apis_lock:
+        apis = list(_shared_apis.values())
+        _shared_apis.clear()
+    for api in apis:
+        api.close()
+
+atexit.register(_close_shared_apis)
 
-def get_porter_quote(name: str, phone: str, pickup_address: str, drop_address: str, city: str, service_type: str = "trucks") -> Dict:
+def get_porter_quote(name: str, phone: str, pickup_address: str, drop_address: str, city: str, service_type: str = "trucks", max_age: int = 3600) -> Dict:
     """
     Convenience function to get Porter quotes without creating an API instance
     
+    Calls with the same name and phone share one browser, which stays open
+    until the interpreter exits (the least recently used one is closed once
+    more than 16 users have called). The shared client is not thread-safe;
+    use PorterAPIPool to fetch quotes in parallel.
+    
     Args:
         name: Your name  
         phone: 10-digit phone number
@@ -532,9 +940,32 @@ def get_porter_quote(name: str, phone: str, pickup_address: str, drop_address: s
         drop_address: Drop location
         city: City name
         service_type: Service type ("trucks", "two_wheelers", "packers_and_movers")
+        max_age: Maximum age in seconds of a cached quote to reuse (0 = always fetch fresh)
         
     Returns:
         Dictionary with quotes or error information
     """
-    api = PorterAPI(name=name, phone=phone)
-    return api.get_quote(pickup_address, drop_address, city, service_type)
+    return _get_api(name, phone, True).get_quote(pickup_address, drop_address, city, service_type, max_age)
+
+def get_porter_quotes_bulk(name: str, phone: str, requests: List[Dict], max_workers: int = 4) -> List[Dict]:
+    """
+    Get many quotes in parallel, each worker driving its own browser
+    
+    Args:
+        name: Your name
+        phone: 10-digit phone number
+        requests: get_quote keyword arguments, one dict per quote
+            (pickup_address, drop_address, city and optionally service_type/max_age)
+        max_workers: Browsers to run side by side. Every extra one costs a few
+            hundred MB of RAM and makes Porter.in rate limiting more likely,
+            so keep this small.
+        
+    Returns:
+        List of quote/error dictionaries in the same order as requests
+    """
+    if not requests:
+        return []
+
+    with PorterAPIPool(name, phone, size=min(max_workers, len(requests))) as pool:
+        with ThreadPoolExecutor(max_workers=pool.size) as executor:
+            return list(executor.map(lambda request: pool.get_quote(**request), requests))
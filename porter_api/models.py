@@ -1,11 +1,24 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Optional
 
 @dataclass
 class VehicleQuote:
+    __slots__ = ("name", "price_range", "min_price", "max_price", "capacity", "capacity_kg")
+
     name: str
     price_range: str
     min_price: Optional[int]
     max_price: Optional[int]
     capacity: str
     capacity_kg: Optional[int]
+
+    def to_dict(self) -> Dict:
+        """Dictionary in the get_quote response format (name is keyed as 'vehicle_name')"""
+        return {
+            "vehicle_name": self.name,
+            "price_range": self.price_range,
+            "min_price": self.min_price,
+            "max_price": self.max_price,
+            "capacity": self.capacity,
+            "capacity_kg": self.capacity_kg
+        }
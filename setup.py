@@ -9,10 +9,9 @@ setup(
     url="https://github.com/your-repo/porter-api-unofficial",
     packages=find_packages(),
     install_requires=[
-        "selenium>=4.0.0",
-        "webdriver-manager>=3.8.0"
+        "selenium>=4.11.0"
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.8",
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -1,5 +1,11 @@
+import asyncio
+import tempfile
+import time
 import unittest
-from porter_api import PorterAPI, get_porter_quote
+from unittest import mock
+from porter_api import PorterAPI, PorterAPIPool, get_porter_quote, get_porter_quotes_bulk
+from porter_api import core
+from porter_api.core import _QuoteCache, _parse_capacity, _parse_price_range
 from porter_api.exceptions import PorterAPIError
 
 class TestPorterAPI(unittest.TestCase):
@@ -18,6 +24,8 @@ class TestPorterAPI(unittest.TestCase):
     def test_invalid_phone(self):
         with self.assertRaises(PorterAPIError):
             PorterAPI(self.valid_name, "12345")
+        with self.assertRaises(PorterAPIError):
+            PorterAPI(self.valid_name, "98765-4321")
 
     def test_invalid_city(self):
         api = PorterAPI(self.valid_name, self.valid_phone)
@@ -29,6 +37,108 @@ class TestPorterAPI(unittest.TestCase):
         with self.assertRaises(PorterAPIError):
             api.get_quote(self.pickup, self.drop, self.valid_city, "invalid_service")
 
+    def test_parse_helpers(self):
+        self.assertEqual(_parse_price_range("₹585 - ₹615"), (585, 615))
+        self.assertEqual(_parse_price_range("₹1,585 - ₹1,615"), (1585, 1615))
+        self.assertEqual(_parse_price_range("₹585 – ₹615"), (585, 615))
+        self.assertEqual(_parse_price_range("Rs. 585 to 615"), (585, 615))
+        self.assertEqual(_parse_price_range("₹585 to ₹615"), (585, 615))
+        self.assertEqual(_parse_price_range("₹585 TO ₹615"), (585, 615))
+        self.assertEqual(_parse_price_range("₹585 — ₹615"), (585, 615))
+        self.assertEqual(_parse_price_range("₹585 − ₹615"), (585, 615))
+        self.assertEqual(_parse_price_range("₹585 ~ ₹615"), (585, 615))
+        self.assertEqual(_parse_price_range("₹1,585 - ₹1,615"), (1585, 1615))
+        self.assertEqual(_parse_price_range("₹585"), (585, 585))
+        self.assertEqual(_parse_price_range("Fare unavailable"), (None, None))
+        self.assertEqual(_parse_capacity("1,500 kg"), 1500)
+        self.assertIsNone(_parse_capacity("N/A"))
+
+    def test_chrome_options(self):
+        options = PorterAPI(self.valid_name, self.valid_phone)._build_chrome_options()
+        self.assertIn("--headless=new", options.arguments)
+        self.assertIn("--disable-extensions", options.arguments)
+        self.assertEqual(options.page_load_strategy, "eager")
+
+        visible = PorterAPI(self.valid_name, self.valid_phone, headless=False)._build_chrome_options()
+        self.assertNotIn("--headless=new", visible.arguments)
+        self.assertFalse(any(arg.startswith("--user-data-dir") for arg in visible.arguments))
+
+        profiled = PorterAPI(self.valid_name, self.valid_phone, profile_dir="/tmp/porter-profile")._build_chrome_options()
+        self.assertIn("--user-data-dir=/tmp/porter-profile", profiled.arguments)
+
+    def test_close_without_browser(self):
+        # No quote requested, so no browser was ever launched
+        with PorterAPI(self.valid_name, self.valid_phone) as api:
+            pass
+        api.close()
+        self.assertIsNone(api._driver)
+
+    def test_invalid_pool_size(self):
+        with self.assertRaises(PorterAPIError):
+            PorterAPIPool(self.valid_name, self.valid_phone, size=0)
+
+    def test_pool_batches_keep_request_order(self):
+        def fake_get_quote(api, pickup_address, drop_address, city, service_type="trucks", max_age=3600):
+            # Finish the earlier requests last, so results arrive out of order
+            time.sleep(0.01 * int(drop_address[-1]))
+            return {"success": True, "drop_address": drop_address}
+
+        requests = [
+            {"pickup_address": self.pickup, "drop_address": f"Drop {n}", "city": self.valid_city}
+            for n in (3, 2, 1)
+        ]
+        expected = ["Drop 3", "Drop 2", "Drop 1"]
+
+        with mock.patch.object(PorterAPI, "_get_driver") as get_driver, \
+                mock.patch.object(PorterAPI, "get_quote", fake_get_quote):
+            self.assertEqual(get_porter_quotes_bulk(self.valid_name, self.valid_phone, []), [])
+            get_driver.assert_not_called()
+
+            results = get_porter_quotes_bulk(self.valid_name, self.valid_phone, requests, max_workers=8)
+            self.assertEqual([result["drop_address"] for result in results], expected)
+            # One browser per request at most, however many workers were allowed
+            self.assertEqual(get_driver.call_count, len(requests))
+
+            get_driver.reset_mock()
+            with PorterAPIPool(self.valid_name, self.valid_phone, size=2) as pool:
+                results = asyncio.run(pool.get_quotes_batch(requests))
+            self.assertEqual([result["drop_address"] for result in results], expected)
+            self.assertEqual(get_driver.call_count, 2)
+
+    def test_cached_quote(self):
+        api = PorterAPI(self.valid_name, self.valid_phone)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            api._cache = _QuoteCache(cache_dir)
+            key = _QuoteCache.key(self.valid_city, self.valid_service, self.pickup, self.drop)
+            api._cache.set(key, {
+                "success": True, "quotes": [], "timestamp_epoch": int(time.time()),
+                "user_name": "Someone Else", "user_phone": "9000000000"
+            })
+            self.assertNotIn("user_phone", api._cache.get(key, max_age=60))
+
+            result = api.get_quote(self.pickup, self.drop, self.valid_city, self.valid_service)
+            self.assertTrue(result["from_cache"])
+            self.assertEqual(result["user_phone"], self.valid_phone)
+            self.assertIsNone(api._cache.get(key, max_age=0))
+
+            # Valid JSON that isn't a response, or has no usable timestamp, is a miss
+            for content in ('[]', '{"success": true}', '{"timestamp_epoch": null}', '{"timestamp_epoch": "soon"}'):
+                with open(api._cache._path(key), "w", encoding="utf-8") as f:
+                    f.write(content)
+                self.assertIsNone(api._cache.get(key, max_age=60))
+
+    def test_shared_client_eviction(self):
+        with mock.patch.object(core, "_MAX_SHARED_APIS", 1), \
+                mock.patch.object(core, "_shared_apis", core.OrderedDict()), \
+                mock.patch.object(PorterAPI, "close") as close:
+            first = core._get_api("First User", self.valid_phone, True)
+            self.assertIs(core._get_api("First User", self.valid_phone, True), first)
+            close.assert_not_called()
+
+            core._get_api("Second User", self.valid_phone, True)
+            close.assert_called_once_with()
+            self.assertNotIn(("First User", self.valid_phone, True), core._shared_apis)
+
     def test_convenience_function(self):
         # This will actually run Selenium and may fail if site structure changes
         result = get_porter_quote(